@@ -9,6 +9,7 @@ Contains no business logic or API code.
 import argparse
 import os
 import sys
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
@@ -19,11 +20,27 @@ from orders import place_order
 
 logger = get_logger("cli")
 
+# ---------------------------------------------------------------------------
+# Credentials
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _load_env_once() -> tuple[str, str]:
+    """Load ``.env`` once per process and return ``(api_key, api_secret)``."""
+    load_dotenv()
+    return (
+        os.environ.get("BINANCE_API_KEY", ""),
+        os.environ.get("BINANCE_API_SECRET", ""),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Argument parsing
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; it holds no per-parse state, so it is reused."""
     parser = argparse.ArgumentParser(
         prog="trading_bot",
         description="Binance Futures Testnet (USDT-M) — Market & Limit order bot",
@@ -42,34 +59,44 @@ def _build_parser() -> argparse.ArgumentParser:
 # Console output helpers
 # ---------------------------------------------------------------------------
 
-def _print_header(text: str) -> None:
+def _header_lines(text: str) -> list[str]:
     width = max(len(text) + 4, 50)
-    print("\n" + "=" * width)
-    print(f"  {text}")
-    print("=" * width)
+    return ["", "=" * width, f"  {text}", "=" * width]
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write *lines* to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _print_order_summary(params: dict) -> None:
-    _print_header("ORDER REQUEST SUMMARY")
-    print(f"  Symbol     : {params['symbol']}")
-    print(f"  Side       : {params['side']}")
-    print(f"  Type       : {params['order_type']}")
-    print(f"  Quantity   : {params['quantity']}")
-    if params.get("price") is not None:
-        print(f"  Price      : {params['price']}")
-    print("-" * 50)
+    lines = _header_lines("ORDER REQUEST SUMMARY")
+    lines += [
+        f"  Symbol     : {params['symbol']}",
+        f"  Side       : {params['side']}",
+        f"  Type       : {params['order_type']}",
+        f"  Quantity   : {params['quantity']}",
+    ]
+    price = params.get("price")
+    if price is not None:
+        lines.append(f"  Price      : {price}")
+    lines.append("-" * 50)
+    _write_lines(lines)
 
 
 def _print_result(result: dict) -> None:
-    _print_header("ORDER CONFIRMATION")
-    print(f"  Order ID   : {result['orderId']}")
-    print(f"  Status     : {result['status']}")
-    print(f"  Symbol     : {result['symbol']}")
-    print(f"  Side       : {result['side']}")
-    print(f"  Type       : {result['type']}")
-    print(f"  Filled Qty : {result['executedQty']}")
-    print(f"  Avg Price  : {result['avgPrice']}")
-    print("=" * 50 + "\n")
+    lines = _header_lines("ORDER CONFIRMATION")
+    lines += [
+        f"  Order ID   : {result['orderId']}",
+        f"  Status     : {result['status']}",
+        f"  Symbol     : {result['symbol']}",
+        f"  Side       : {result['side']}",
+        f"  Type       : {result['type']}",
+        f"  Filled Qty : {result['executedQty']}",
+        f"  Avg Price  : {result['avgPrice']}",
+        "=" * 50 + "\n",
+    ]
+    _write_lines(lines)
 
 
 def _print_error(message: str) -> None:
@@ -82,8 +109,6 @@ def _print_error(message: str) -> None:
 
 def main() -> int:
     """Run the trading bot CLI. Returns an exit code (0 = success)."""
-    load_dotenv()
-
     logger.info("Application started")
 
     parser = _build_parser()
@@ -106,8 +131,7 @@ def main() -> int:
     _print_order_summary(params)
 
     # ---- Load credentials -----------------------------------------------
-    api_key = os.environ.get("BINANCE_API_KEY", "")
-    api_secret = os.environ.get("BINANCE_API_SECRET", "")
+    api_key, api_secret = _load_env_once()
     if not api_key or not api_secret:
         msg = (
             "Missing API credentials. Set BINANCE_API_KEY and "
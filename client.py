@@ -7,10 +7,13 @@ response parsing.  Contains NO business logic.
 
 import hashlib
 import hmac
+import logging
+import re
 import time
-from urllib.parse import urlencode
+from urllib.parse import quote_plus
 
-import requests
+import httpx
+import orjson
 
 from logging_config import get_logger, sanitize_params
 
@@ -21,6 +24,84 @@ logger = get_logger("client")
 # ---------------------------------------------------------------------------
 DEFAULT_BASE_URL = "https://testnet.binancefuture.com"
 
+# Milliseconds a signed request stays valid after its timestamp.
+_RECV_WINDOW = 5000
+
+
+# ---------------------------------------------------------------------------
+# Shared HTTP sessions
+# ---------------------------------------------------------------------------
+# One HTTP/2 client (and therefore one connection pool) per base URL and pool
+# size, shared by every BinanceClient in the process so TLS connections are
+# reused across instances.  The API key is sent per request, never stored on
+# the client.
+DEFAULT_POOL_MAXSIZE = 32
+
+# Connection attempts only: httpx never retries once a request has been
+# sent, so an order POST that reached the exchange is never re-submitted.
+_CONNECT_RETRIES = 2
+
+_SESSIONS: dict[tuple[str, int], httpx.Client] = {}
+
+
+def _get_session(base_url: str, pool_maxsize: int) -> httpx.Client:
+    """Return the shared client for *base_url* and *pool_maxsize*, creating it on first use."""
+    key = (base_url, pool_maxsize)
+    session = _SESSIONS.get(key)
+    if session is None:
+        # HTTP/2 is negotiated via ALPN; servers that refuse it get HTTP/1.1.
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=_CONNECT_RETRIES,
+            limits=httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=min(16, pool_maxsize),
+            ),
+        )
+        # Proxies / CA bundles come from code, not the environment.
+        session = httpx.Client(
+            transport=transport,
+            trust_env=False,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        _SESSIONS[key] = session
+    return session
+
+
+# ---------------------------------------------------------------------------
+# Query-string encoding
+# ---------------------------------------------------------------------------
+# Text made only of these characters comes out of ``quote_plus`` unchanged,
+# which covers every key and value of a validated order (field names,
+# symbols, enums, decimal strings, integer timestamps).
+_URL_SAFE = re.compile(r"[A-Za-z0-9_.~-]*")
+
+
+def _encode_component(obj) -> bytes:
+    """Encode one key or value exactly as ``urlencode`` would."""
+    if isinstance(obj, bytes):
+        return quote_plus(obj).encode("ascii")
+    text = str(obj)
+    if not _URL_SAFE.fullmatch(text):
+        text = quote_plus(text)
+    return text.encode("ascii")
+
+
+def _encode_query(params: dict) -> bytearray:
+    """Form-encode *params* into a bytearray.
+
+    Byte-for-byte identical to ``urlencode(params).encode("ascii")`` but
+    only runs ``quote_plus`` on keys and values that need escaping.
+    """
+    buf = bytearray()
+    for key, value in params.items():
+        if buf:
+            buf += b"&"
+        buf += _encode_component(key)
+        buf += b"="
+        buf += _encode_component(value)
+    return buf
+
 
 # ---------------------------------------------------------------------------
 # Custom exceptions
@@ -57,16 +138,19 @@ class BinanceClient:
         api_secret: str,
         base_url: str = DEFAULT_BASE_URL,
         timeout: int = 10,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
     ):
         self._api_key = api_key
-        self._api_secret = api_secret
+        # Keyed HMAC template: the key schedule runs once here and each
+        # request signs from a .copy() of the pre-keyed state.
+        self._signer = hmac.new(
+            api_secret.encode("utf-8"), digestmod=hashlib.sha256,
+        )
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
-        self._session = requests.Session()
-        self._session.headers.update({
-            "X-MBX-APIKEY": self._api_key,
-            "Content-Type": "application/x-www-form-urlencoded",
-        })
+        self._session = _get_session(self._base_url, pool_maxsize)
+        self._order_url = f"{self._base_url}/fapi/v1/order"
+        self._batch_url = f"{self._base_url}/fapi/v1/batchOrders"
 
     # ------------------------------------------------------------------
     # Public
@@ -78,70 +162,97 @@ class BinanceClient:
             BinanceAPIError -- on a structured error from the exchange
             NetworkError    -- on a transport-level failure
         """
-        endpoint = "/fapi/v1/order"
-        return self._signed_request("POST", endpoint, params)
+        return self._signed_request(self._order_url, params)
+
+    def place_batch_orders(self, orders: list[dict]) -> list:
+        """Send up to five orders in one signed POST to ``/fapi/v1/batchOrders``.
+
+        Returns the JSON list from the exchange, one entry per order in
+        request order.  Each entry is either the order body or a
+        ``{"code": ..., "msg": ...}`` error for that order alone.
+
+        Raises:
+            BinanceAPIError -- when the batch as a whole is rejected
+            NetworkError    -- on a transport-level failure
+        """
+        params = {"batchOrders": orjson.dumps(orders).decode("utf-8")}
+        return self._signed_request(self._batch_url, params)
 
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
-    def _signed_request(self, method: str, endpoint: str, params: dict) -> dict:
-        """Add timestamp + signature, send the request, return JSON."""
-        params = dict(params)  # shallow copy — don't mutate caller's dict
-        params["timestamp"] = int(time.time() * 1000)
-        params["recvWindow"] = 5000
-
-        query_string = urlencode(params)
-        signature = hmac.new(
-            self._api_secret.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-        params["signature"] = signature
-
-        url = f"{self._base_url}{endpoint}"
-
-        logger.debug(
-            "API request  — %s %s params=%s",
-            method, url, sanitize_params(params),
-        )
+    def _signed_request(self, url: str, params: dict) -> dict | list:
+        """Add timestamp + signature, POST the form body to *url*, return JSON."""
+        timestamp = time.time_ns() // 1_000_000
+
+        # Auth fields are appended to the encoded bytes rather than to a
+        # copy of the caller's dict, so *params* is never copied or mutated.
+        query = _encode_query(params)
+        if query:
+            query += b"&"
+        query += b"timestamp=%d&recvWindow=%d" % (timestamp, _RECV_WINDOW)
+
+        signer = self._signer.copy()
+        signer.update(query)
+        signature = signer.hexdigest()
+        query += b"&signature="
+        query += signature.encode("ascii")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "API request  — POST %s params=%s",
+                url, sanitize_params({
+                    **params,
+                    "timestamp": timestamp,
+                    "recvWindow": _RECV_WINDOW,
+                    "signature": signature,
+                }),
+            )
 
         start = time.monotonic()
         try:
-            response = self._session.request(
-                method, url, params=params, timeout=self._timeout,
+            response = self._session.post(
+                url, content=bytes(query),
+                headers={"X-MBX-APIKEY": self._api_key},
+                timeout=self._timeout,
             )
             elapsed_ms = (time.monotonic() - start) * 1000
-        except requests.exceptions.ConnectionError as exc:
-            logger.error("Network error — %s %s — %s", method, url, exc)
+        except httpx.ConnectError as exc:
+            logger.error("Network error — POST %s — %s", url, exc)
             raise NetworkError(f"Connection failed: {exc}") from exc
-        except requests.exceptions.Timeout as exc:
-            logger.error("Request timeout — %s %s — %s", method, url, exc)
+        except httpx.TimeoutException as exc:
+            logger.error("Request timeout — POST %s — %s", url, exc)
             raise NetworkError(f"Request timed out: {exc}") from exc
-        except requests.exceptions.RequestException as exc:
-            logger.error("Request error — %s %s — %s", method, url, exc)
+        except httpx.RequestError as exc:
+            logger.error("Request error — POST %s — %s", url, exc)
             raise NetworkError(f"Request failed: {exc}") from exc
 
-        logger.debug(
-            "API response — %s %s — HTTP %d (%.0f ms) body=%s",
-            method, url, response.status_code, elapsed_ms, response.text,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "API response — POST %s — HTTP %d (%.0f ms) body=%s",
+                url, response.status_code, elapsed_ms,
+                response.content.decode("utf-8", "replace"),
+            )
 
-        # Parse JSON
+        # Parse JSON (orjson.JSONDecodeError subclasses ValueError)
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
         except ValueError:
+            # Decode the raw bytes directly: ``response.text`` would run
+            # charset detection over the whole body first.
+            snippet = response.content[:200].decode("utf-8", "replace")
             logger.error(
                 "Non-JSON response — HTTP %d body=%s",
-                response.status_code, response.text,
+                response.status_code, snippet,
             )
             raise BinanceAPIError(
                 code=-1,
-                message=f"Unexpected non-JSON response: {response.text[:200]}",
+                message=f"Unexpected non-JSON response: {snippet}",
                 http_status=response.status_code,
             )
 
         # Check for Binance-level error
-        if "code" in data and data["code"] != 200:
+        if isinstance(data, dict) and "code" in data and data["code"] != 200:
             raise BinanceAPIError(
                 code=data["code"],
                 message=data.get("msg", "Unknown error"),
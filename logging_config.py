@@ -5,7 +5,6 @@ Provides a centralized, structured logger with file rotation and
 credential sanitization. All modules import `get_logger` from here.
 """
 
-import copy
 import logging
 import os
 from logging.handlers import RotatingFileHandler
@@ -18,15 +17,16 @@ _SENSITIVE_KEYS = frozenset({
     "api_key", "apikey", "apiKey", "secret", "api_secret",
     "apiSecret", "signature", "password", "token",
 })
+_SENSITIVE_NORMALIZED = frozenset(k.lower().replace("_", "") for k in _SENSITIVE_KEYS)
 
 
 def sanitize_params(params: dict) -> dict:
     """Return a shallow copy of *params* with sensitive fields redacted."""
     if not isinstance(params, dict):
         return params
-    cleaned = copy.copy(params)
-    for key in list(cleaned.keys()):
-        if key.lower().replace("_", "") in {k.lower().replace("_", "") for k in _SENSITIVE_KEYS}:
+    cleaned = dict(params)
+    for key in params:
+        if key.lower().replace("_", "") in _SENSITIVE_NORMALIZED:
             cleaned[key] = "***REDACTED***"
     return cleaned
 
@@ -62,12 +62,13 @@ def _setup_root_logger() -> None:
     root = logging.getLogger("trading_bot")
     root.setLevel(logging.DEBUG)
 
-    # File handler — DEBUG and above
+    # File handler — DEBUG and above; the file is opened on first write
     fh = RotatingFileHandler(
         _LOG_FILE,
         maxBytes=10 * 1024 * 1024,   # 10 MB
         backupCount=5,
         encoding="utf-8",
+        delay=True,
     )
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(logging.Formatter(_LOG_FORMAT, datefmt=_DATE_FORMAT))
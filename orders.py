@@ -6,10 +6,15 @@ validated parameters, calls the Binance client, and returns a structured
 result.  All business-logic decisions live here.
 """
 
+from client import BinanceAPIError
 from logging_config import get_logger
+from validators import ValidationError, validate_order_params
 
 logger = get_logger("orders")
 
+# Binance caps ``/fapi/v1/batchOrders`` at five orders per request.
+MAX_BATCH_ORDERS = 5
+
 
 def place_order(
     client,
@@ -46,15 +51,7 @@ def place_order(
 
     raw = client.place_order(payload)
 
-    result = {
-        "orderId": raw.get("orderId"),
-        "status": raw.get("status"),
-        "symbol": raw.get("symbol"),
-        "side": raw.get("side"),
-        "type": raw.get("type"),
-        "executedQty": raw.get("executedQty", "0"),
-        "avgPrice": raw.get("avgPrice", "0"),
-    }
+    result = _extract_result(raw)
 
     logger.info(
         "Order placed successfully — orderId=%s status=%s executedQty=%s avgPrice=%s",
@@ -65,6 +62,95 @@ def place_order(
     return result
 
 
+def place_orders(client, orders: list[dict]) -> list[dict]:
+    """Place up to ``MAX_BATCH_ORDERS`` orders in a single signed request.
+
+    Each entry of *orders* holds the raw fields of one order (``symbol``,
+    ``side``, ``order_type``, ``quantity`` and optional ``price``) and is
+    run through :func:`validate_order_params` before anything is sent.
+    The exchange accepts or rejects every order independently, so the
+    returned list mirrors *orders*: accepted orders yield the same dict as
+    :func:`place_order`, rejected ones yield ``{"code": ..., "msg": ...}``.
+
+    Raises:
+        ValueError      -- if the batch is empty or too large
+        ValidationError -- if an entry is invalid; ``field`` is prefixed
+                           with the entry index, e.g. ``orders[2].price``
+        BinanceAPIError -- if the exchange does not return one result per order
+    """
+    if not 1 <= len(orders) <= MAX_BATCH_ORDERS:
+        raise ValueError(
+            f"A batch must contain 1 to {MAX_BATCH_ORDERS} orders, got {len(orders)}."
+        )
+
+    payloads = []
+    for index, order in enumerate(orders):
+        try:
+            clean = validate_order_params(
+                symbol=order.get("symbol"),
+                side=order.get("side"),
+                order_type=order.get("order_type"),
+                quantity=order.get("quantity"),
+                price=order.get("price"),
+            )
+        except ValidationError as exc:
+            raise ValidationError(
+                f"orders[{index}].{exc.field}", exc.value, exc.message,
+            ) from exc
+        payloads.append(_build_payload(
+            clean["symbol"], clean["side"], clean["order_type"],
+            clean["quantity"], clean["price"],
+        ))
+
+    logger.info("Placing batch of %d orders", len(payloads))
+
+    raw_results = client.place_batch_orders(payloads)
+    if len(raw_results) != len(payloads):
+        raise BinanceAPIError(
+            code=-1,
+            message=(
+                f"Batch response has {len(raw_results)} results "
+                f"for {len(payloads)} orders"
+            ),
+        )
+
+    results = []
+    for payload, raw in zip(payloads, raw_results):
+        if "code" in raw:
+            logger.warning(
+                "Batch order rejected — symbol=%s side=%s code=%s msg=%s",
+                payload["symbol"], payload["side"], raw["code"], raw.get("msg"),
+            )
+            results.append({"code": raw["code"], "msg": raw.get("msg", "Unknown error")})
+            continue
+        result = _extract_result(raw)
+        logger.info(
+            "Batch order placed — orderId=%s status=%s executedQty=%s avgPrice=%s",
+            result["orderId"], result["status"],
+            result["executedQty"], result["avgPrice"],
+        )
+        results.append(result)
+
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Response extraction
+# ---------------------------------------------------------------------------
+
+def _extract_result(raw: dict) -> dict:
+    """Pick the fields callers care about out of a raw order response."""
+    return {
+        "orderId": raw.get("orderId"),
+        "status": raw.get("status"),
+        "symbol": raw.get("symbol"),
+        "side": raw.get("side"),
+        "type": raw.get("type"),
+        "executedQty": raw.get("executedQty", "0"),
+        "avgPrice": raw.get("avgPrice", "0"),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Payload construction
 # ---------------------------------------------------------------------------
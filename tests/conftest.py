@@ -0,0 +1,10 @@
+"""Shared pytest setup: import the flat top-level modules, keep logs out of the repo."""
+
+import os
+import sys
+import tempfile
+
+# Must be set before logging_config is first imported.
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp(prefix="trading_bot_logs_"))
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
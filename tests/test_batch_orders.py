@@ -0,0 +1,135 @@
+"""Tests for the batch order path (orders.place_orders / BinanceClient.place_batch_orders)."""
+
+import hashlib
+import hmac
+import json
+from urllib.parse import parse_qsl
+
+import pytest
+
+from client import BinanceAPIError, BinanceClient
+from orders import MAX_BATCH_ORDERS, place_orders
+from validators import ValidationError
+
+LIMIT_ORDER = {
+    "symbol": "btcusdt", "side": "buy", "order_type": "limit",
+    "quantity": "0.01", "price": "50000",
+}
+MARKET_ORDER = {
+    "symbol": "ETHUSDT", "side": "SELL", "order_type": "MARKET",
+    "quantity": "0.1",
+}
+
+
+class StubClient:
+    """Records the payloads it is given and replays a canned response."""
+
+    def __init__(self, response):
+        self.response = response
+        self.sent = None
+
+    def place_batch_orders(self, payloads):
+        self.sent = payloads
+        return self.response
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, status_code: int = 200):
+        self.content = body
+        self.status_code = status_code
+
+
+class FakeSession:
+    """Stands in for the shared httpx client and captures the POST."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.calls = []
+
+    def post(self, url, content, headers, timeout):
+        self.calls.append({"url": url, "content": content, "headers": headers})
+        return FakeResponse(self.body)
+
+
+# ---------------------------------------------------------------------------
+# orders.place_orders
+# ---------------------------------------------------------------------------
+
+def test_place_orders_maps_mixed_results():
+    stub = StubClient([
+        {"orderId": 1, "status": "NEW", "symbol": "BTCUSDT", "side": "BUY",
+         "type": "LIMIT", "executedQty": "0", "avgPrice": "0"},
+        {"code": -2019, "msg": "Margin is insufficient."},
+    ])
+
+    results = place_orders(stub, [LIMIT_ORDER, MARKET_ORDER])
+
+    assert stub.sent == [
+        {"symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT", "quantity": "0.01",
+         "timeInForce": "GTC", "price": "50000"},
+        {"symbol": "ETHUSDT", "side": "SELL", "type": "MARKET", "quantity": "0.1"},
+    ]
+    assert results[0]["orderId"] == 1
+    assert results[0]["status"] == "NEW"
+    assert results[1] == {"code": -2019, "msg": "Margin is insufficient."}
+
+
+def test_place_orders_keeps_float_inputs_short():
+    stub = StubClient([{"orderId": 1, "status": "NEW"}])
+    order = dict(LIMIT_ORDER, quantity=0.1, price=50000.5)
+
+    place_orders(stub, [order])
+
+    assert stub.sent[0]["quantity"] == "0.1"
+    assert stub.sent[0]["price"] == "50000.5"
+
+
+@pytest.mark.parametrize("count", [0, MAX_BATCH_ORDERS + 1])
+def test_place_orders_rejects_batch_size(count):
+    stub = StubClient([])
+    with pytest.raises(ValueError):
+        place_orders(stub, [MARKET_ORDER] * count)
+    assert stub.sent is None
+
+
+def test_place_orders_reports_invalid_entry_index():
+    stub = StubClient([])
+    bad = dict(LIMIT_ORDER, price=None)
+    with pytest.raises(ValidationError) as info:
+        place_orders(stub, [MARKET_ORDER, bad])
+    assert info.value.field == "orders[1].price"
+    assert stub.sent is None
+
+
+def test_place_orders_rejects_short_response():
+    stub = StubClient([{"orderId": 1, "status": "NEW"}])
+    with pytest.raises(BinanceAPIError):
+        place_orders(stub, [LIMIT_ORDER, MARKET_ORDER])
+
+
+# ---------------------------------------------------------------------------
+# BinanceClient.place_batch_orders
+# ---------------------------------------------------------------------------
+
+def test_place_batch_orders_encodes_and_signs():
+    client = BinanceClient("key", "secret", base_url="https://example.test")
+    client._session = FakeSession(b'[{"orderId":1},{"code":-1,"msg":"x"}]')
+    payloads = [
+        {"symbol": "BTCUSDT", "side": "BUY", "type": "MARKET", "quantity": "0.01"},
+    ]
+
+    data = client.place_batch_orders(payloads)
+
+    assert data == [{"orderId": 1}, {"code": -1, "msg": "x"}]
+    (call,) = client._session.calls
+    assert call["url"] == "https://example.test/fapi/v1/batchOrders"
+    assert call["headers"] == {"X-MBX-APIKEY": "key"}
+
+    body, _, signature = call["content"].rpartition(b"&signature=")
+    expected = hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+    assert signature.decode("ascii") == expected
+
+    fields = dict(parse_qsl(body.decode("ascii")))
+    assert json.loads(fields["batchOrders"]) == payloads
+    assert fields["recvWindow"] == "5000"
+    assert fields["timestamp"].isdigit()
@@ -0,0 +1,21 @@
+"""Tests for client._encode_query."""
+
+from urllib.parse import urlencode
+
+import pytest
+
+from client import _encode_query
+
+
+@pytest.mark.parametrize("params", [
+    {
+        "symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT", "quantity": "0.01",
+        "timeInForce": "GTC", "price": "50000", "timestamp": 1700000000000,
+        "recvWindow": 5000,
+    },
+    {"symbol": "BTC&USDT", "quantity": "1 000"},
+    {"batchOrders": '[{"symbol":"BTCUSDT","quantity":"0.01"}]'},
+    {"a b": "1", "clé": "é", b"raw": b"\xff&"},
+])
+def test_encode_query_matches_urlencode(params):
+    assert bytes(_encode_query(params)) == urlencode(params).encode("ascii")
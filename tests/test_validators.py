@@ -0,0 +1,48 @@
+"""Tests for validators.validate_order_params."""
+
+import pytest
+
+from validators import ValidationError, validate_order_params
+
+
+def _quantity(value):
+    return validate_order_params("btcusdt", "buy", "market", value)["quantity"]
+
+
+@pytest.mark.parametrize("value", ["0.01", "1.50"])
+def test_plain_decimal_returned_unchanged(value):
+    assert _quantity(value) == value
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("1e2", "100"),
+    ("00.5", "0.5"),
+    ("١.٥", "1.5"),
+])
+def test_non_plain_input_normalized_to_fixed_point(value, expected):
+    assert _quantity(value) == expected
+
+
+@pytest.mark.parametrize("value", ["0", "0.0", "NaN", "Infinity", "-1"])
+def test_non_positive_or_non_finite_rejected(value):
+    with pytest.raises(ValidationError) as info:
+        _quantity(value)
+    assert info.value.field == "quantity"
+
+
+def test_limit_price_uses_same_rules():
+    params = validate_order_params("btcusdt", "buy", "limit", "0.01", "00.5")
+    assert params["price"] == "0.5"
+    with pytest.raises(ValidationError) as info:
+        validate_order_params("btcusdt", "buy", "limit", "0.01", "0.0")
+    assert info.value.field == "price"
+
+
+def test_result_is_normalized():
+    assert validate_order_params(" btcusdt ", "Sell", "Limit", "1", "30000") == {
+        "symbol": "BTCUSDT",
+        "side": "SELL",
+        "order_type": "LIMIT",
+        "quantity": "1",
+        "price": "30000",
+    }
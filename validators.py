@@ -5,6 +5,7 @@ All validation is performed here *before* any API call is made.
 The module is pure logic — no I/O, no network, no side effects.
 """
 
+import re
 from decimal import Decimal, InvalidOperation
 
 from logging_config import get_logger
@@ -37,6 +38,10 @@ class ValidationError(Exception):
 _VALID_SIDES = {"BUY", "SELL"}
 _VALID_ORDER_TYPES = {"MARKET", "LIMIT"}
 
+# Plain unsigned ASCII decimals without leading zeros ("0.01", "30000") —
+# the usual CLI input, already in the form Binance expects.
+_PLAIN_DECIMAL = re.compile(r"(?:0|[1-9][0-9]*)(?:\.[0-9]+)?")
+
 
 def validate_order_params(
     symbol: str,
@@ -53,27 +58,27 @@ def validate_order_params(
             "symbol":     "BTCUSDT",
             "side":       "BUY",
             "order_type": "LIMIT",
-            "quantity":   Decimal("0.01"),
-            "price":      Decimal("30000"),   # None for MARKET
+            "quantity":   "0.01",
+            "price":      "30000",   # None for MARKET
         }
 
     Raises ``ValidationError`` on the first failing rule.
     """
 
     # --- Symbol ---
-    if not symbol or not symbol.strip():
+    clean_symbol = _normalize(symbol)
+    if not clean_symbol:
         raise ValidationError("symbol", symbol, "Symbol must be a non-empty string.")
-    clean_symbol = symbol.strip().upper()
 
     # --- Side ---
-    clean_side = side.strip().upper() if side else ""
+    clean_side = _normalize(side)
     if clean_side not in _VALID_SIDES:
         raise ValidationError(
             "side", side, f"Expected one of: {', '.join(sorted(_VALID_SIDES))}."
         )
 
     # --- Order type ---
-    clean_type = order_type.strip().upper() if order_type else ""
+    clean_type = _normalize(order_type)
     if clean_type not in _VALID_ORDER_TYPES:
         raise ValidationError(
             "order_type",
@@ -82,16 +87,7 @@ def validate_order_params(
         )
 
     # --- Quantity ---
-    try:
-        qty = Decimal(quantity)
-    except (InvalidOperation, TypeError, ValueError):
-        raise ValidationError(
-            "quantity", quantity, "Must be a valid positive number (e.g. 0.01)."
-        )
-    if qty <= 0:
-        raise ValidationError(
-            "quantity", quantity, "Must be strictly greater than zero."
-        )
+    qty = _parse_positive("quantity", quantity, "0.01")
 
     # --- Price (conditional on order type) ---
     clean_price = None
@@ -102,16 +98,7 @@ def validate_order_params(
                 price,
                 "Price is required for LIMIT orders.",
             )
-        try:
-            clean_price = Decimal(price)
-        except (InvalidOperation, TypeError, ValueError):
-            raise ValidationError(
-                "price", price, "Must be a valid positive number (e.g. 30000)."
-            )
-        if clean_price <= 0:
-            raise ValidationError(
-                "price", price, "Must be strictly greater than zero."
-            )
+        clean_price = _parse_positive("price", price, "30000")
 
     logger.debug(
         "Validation passed — symbol=%s side=%s type=%s qty=%s price=%s",
@@ -125,3 +112,46 @@ def validate_order_params(
         "quantity": qty,
         "price": clean_price,
     }
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+def _normalize(value: str | None) -> str:
+    """Strip and upper-case *value*; ``""`` for ``None`` or empty input.
+
+    Already-uppercase input (the common case) skips the ``upper()`` copy.
+    """
+    if not value:
+        return ""
+    value = value.strip()
+    return value if value.isupper() else value.upper()
+
+
+def _parse_positive(field: str, value, example: str) -> str:
+    """Check that *value* is a number > 0 and return it as a plain decimal string.
+
+    Plain decimals are accepted as-is without building a ``Decimal``;
+    anything else (whitespace, signs, exponents, leading zeros, non-ASCII
+    digits) goes through ``Decimal`` and is re-rendered in fixed-point
+    notation.  Floats are converted via ``str()`` first so ``0.1`` stays
+    ``"0.1"`` rather than its full binary expansion.
+    """
+    if isinstance(value, float):
+        value = str(value)
+    if isinstance(value, str) and _PLAIN_DECIMAL.fullmatch(value):
+        if not value.strip("0."):
+            raise ValidationError(field, value, "Must be strictly greater than zero.")
+        return value
+
+    try:
+        number = Decimal(value)
+    except (InvalidOperation, TypeError, ValueError):
+        number = None
+    if number is None or not number.is_finite():
+        raise ValidationError(
+            field, value, f"Must be a valid positive number (e.g. {example})."
+        )
+    if number <= 0:
+        raise ValidationError(field, value, "Must be strictly greater than zero.")
+    return format(number, "f")